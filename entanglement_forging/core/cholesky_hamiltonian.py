@@ -109,14 +109,14 @@ def get_fermionic_ops_with_cholesky(
         occupied_orbitals_to_reduce = []
     C = mo_coeff
     del mo_coeff
-    h1 = np.einsum("pi,pr->ir", C, h1)
-    h1 = np.einsum("rj,ir->ij", C, h1)  # h_{pq} in MO basis
+    h1 = np.einsum("pi,pr->ir", C, h1, optimize=True)
+    h1 = np.einsum("rj,ir->ij", C, h1, optimize=True)  # h_{pq} in MO basis
 
     # do the Cholesky decomposition:
     if h2 is not None:
         ng, L = modified_cholesky(h2, epsilon_cholesky)
         if verbose:
-            h2_mcd = np.einsum("prg,qsg->prqs", L, L)
+            h2_mcd = np.einsum("prg,qsg->prqs", L, L, optimize=True)
             Log.log("mcd threshold =", epsilon_cholesky)
             Log.log(
                 "deviation between mcd and original eri =", np.abs(h2_mcd - h2).max()
@@ -125,7 +125,7 @@ def get_fermionic_ops_with_cholesky(
             Log.log("L.shape = ", L.shape)
             del h2_mcd
         # obtain the L_{pr,g} in the MO basis
-        L = np.einsum("prg,pi,rj->ijg", L, C, C)
+        L = np.einsum("prg,pi,rj->ijg", L, C, C, optimize=True)
     else:
         size = len(h1)
         ng, L = 0, np.zeros(shape=(size, size, 0))
@@ -154,16 +154,17 @@ def get_fermionic_ops_with_cholesky(
 
         freeze_shift = (
             2 * np.einsum("pp", h1_frozenpart)
-            + 2 * np.einsum("ppg,qqg", L_frozenpart, L_frozenpart)
-            - np.einsum("pqg,qpg", L_frozenpart, L_frozenpart)
+            + 2 * np.einsum("ppg,qqg", L_frozenpart, L_frozenpart, optimize=True)
+            - np.einsum("pqg,qpg", L_frozenpart, L_frozenpart, optimize=True)
         )
         h1 = (
             h1_activepart
-            + 2 * np.einsum("ppg,qsg->qs", L_frozenpart, L_activepart)
+            + 2 * np.einsum("ppg,qsg->qs", L_frozenpart, L_activepart, optimize=True)
             - np.einsum(
                 "psg,qpg->qs",
                 L[np.ix_(occupied_orbitals_to_reduce, orbitals_not_to_reduce)],
                 L[np.ix_(orbitals_not_to_reduce, occupied_orbitals_to_reduce)],
+                optimize=True,
             )
         )
         L = L_activepart
@@ -183,7 +184,7 @@ def get_fermionic_ops_with_cholesky(
     else:
         pass
 
-    h2 = np.einsum("prg,qsg->prqs", L, L)
+    h2 = np.einsum("prg,qsg->prqs", L, L, optimize=True)
     if halve_transformed_h2:
         h2 /= 2
     h1_int = OneBodyElectronicIntegrals(basis=ElectronicBasis.SO, matrices=h1)
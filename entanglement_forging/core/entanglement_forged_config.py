@@ -45,6 +45,12 @@ class EntanglementForgedConfig:
         rep_delay (float): Delay between programs in seconds.
         shots (int): The total number of shots for the simulation
                 (overwritten for the statevector backend).
+        parallel_workers (int): Number of worker threads used to analyze the
+                results of independent (parameter set, bootstrap resample)
+                combinations in parallel. Defaults to 1 (serial analysis).
+        optimization_level (int): Optimization level passed to the Qiskit transpiler.
+                Defaults to 0 for statevector simulators, where the optimization
+                passes cost time but give no fidelity benefit, and to 1 otherwise.
         fix_first_bitstring (bool): Bypasses computation of first bitstring and replaces
                 result with HF energy. Can speed up the computation, but requires ansatz
                 that leaves the HF state unchanged under var_form. bootstrap_trials (int):
@@ -87,6 +93,8 @@ class EntanglementForgedConfig:
         meas_error_refresh_period_minutes=30,
         bootstrap_trials=None,
         zero_noise_extrap=False,
+        optimization_level=None,
+        parallel_workers=1,
     ):
         """The constructor for the EntanglementForgedConfig class."""
         statevector_sims = ["statevector_simulator", "aer_simulator_statevector"]
@@ -114,6 +122,9 @@ class EntanglementForgedConfig:
             self.rep_delay = None
 
         self.shots = shots if self.backend_name not in statevector_sims else 1
+        if optimization_level is None:
+            optimization_level = 0 if self.backend_name in statevector_sims else 1
+        self.optimization_level = optimization_level
         self.fix_first_bitstring = fix_first_bitstring
         self.bootstrap_trials = bootstrap_trials
         self.copysample_job_size = (
@@ -123,6 +134,7 @@ class EntanglementForgedConfig:
         self.meas_error_shots = meas_error_shots
         self.meas_error_refresh_period_minutes = meas_error_refresh_period_minutes
         self.zero_noise_extrap = [1, 3] if zero_noise_extrap else [1]
+        self.parallel_workers = parallel_workers
         self.validate()
 
     def validate(self):
@@ -57,9 +57,9 @@ class EntanglementForgedDriver(ElectronicStructureDriver):
         """
         super().__init__()
 
-        self._hcore = hcore
-        self._mo_coeff = mo_coeff
-        self._eri = eri
+        self._hcore = np.asarray(hcore)
+        self._mo_coeff = np.asarray(mo_coeff)
+        self._eri = np.asarray(eri)
         self._num_alpha = num_alpha
         self._num_beta = num_beta
         self._nuclear_repulsion_energy = nuclear_repulsion_energy
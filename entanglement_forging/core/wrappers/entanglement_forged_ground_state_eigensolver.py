@@ -135,7 +135,12 @@ class EntanglementForgedGroundStateSolver(GroundStateSolver):
 
         start_time = time.time()
 
-        problem.driver.run()
+        # ForgedOperator and ClassicalEnergies below read the problem's
+        # grouped property, which second_q_ops() populates (running the
+        # driver in the process). Only do that work if the caller has not
+        # already done it, rather than unconditionally re-running the driver.
+        if problem.grouped_property is None:
+            problem.second_q_ops()
 
         # Decompose the Hamiltonian operators into a form appropraite for EF
         forged_operator = ForgedOperator(
@@ -15,6 +15,7 @@
 import datetime
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, Tuple, Callable, Union
 
 import numpy as np
@@ -41,6 +42,7 @@ from entanglement_forging.utils.copysample_circuits import (
     combine_copysampled_results,
 )
 from entanglement_forging.utils.forging_subroutines import (
+    bind_wavefn_circuits,
     prepare_circuits_to_execute,
     make_stateprep_circuits,
     eval_forged_op_with_result,
@@ -166,6 +168,8 @@ class EntanglementForgedVQE(VQE):
         )
         self._meas_error_refresh_timestamp = None
         self._coupling_map = self._backend.configuration().coupling_map
+        self._optimization_level = config.optimization_level
+        self._parallel_workers = config.parallel_workers
         self._meas_fitter = None
         self._bootstrap_trials = config.bootstrap_trials
         self._no_bs0_circuits = config.fix_first_bitstring
@@ -200,6 +204,21 @@ class EntanglementForgedVQE(VQE):
         self._op_for_generating_superpos_circuits = None
         self._load_ops()
 
+        # For statevector simulation the wavefunction circuits do not change
+        # structure between energy evaluations, so the stateprep and ansatz
+        # circuits are composed and transpiled once here; each evaluation then
+        # only binds new parameter values into them.
+        self._transpiled_tensor_circuits = []
+        self._transpiled_superpos_circuits = []
+        if self._is_sv_sim:
+            self._transpiled_tensor_circuits = self._transpile_wavefn_circuits(
+                self._tensor_prep_circuits_u + self._tensor_prep_circuits_v
+            )
+            if len(self._pauli_names_for_superpos_states) > 0:
+                self._transpiled_superpos_circuits = self._transpile_wavefn_circuits(
+                    self._superpos_prep_circuits_u + self._superpos_prep_circuits_v
+                )
+
     @property
     def shots_multiplier(self):
         """Return the shots multiplier."""
@@ -220,6 +239,26 @@ class EntanglementForgedVQE(VQE):
         """Set the bootstrap trials."""
         self._bootstrap_trials = trials
 
+    def _transpile_wavefn_circuits(self, stateprep_circuits):
+        """Composes each stateprep circuit with the (unbound) ansatz and
+        transpiles the result once, preserving the stateprep names used
+        for result lookup."""
+        if len(stateprep_circuits) == 0:
+            return []
+        wavefn_circuits = [
+            prep_circ.compose(self._ansatz) for prep_circ in stateprep_circuits
+        ]
+        transpiled_circuits = transpile(
+            wavefn_circuits,
+            self._backend,
+            initial_layout=self._initial_layout,
+            coupling_map=self._coupling_map,
+            optimization_level=self._optimization_level,
+        )
+        if not isinstance(transpiled_circuits, list):
+            transpiled_circuits = [transpiled_circuits]
+        return transpiled_circuits
+
     def _load_ops(self):
         # Get the weighted Pauli deconstruction of the operator
         (
@@ -434,6 +473,20 @@ class EntanglementForgedVQE(VQE):
         for params_idx, params in enumerate(parameter_sets):
             Log.log("Constructing the circuits for parameter set", params, "...")
 
+            if self._is_sv_sim:
+                # The statevector circuits were composed and transpiled at
+                # construction time; only the parameter values change here.
+                tensor_circuits_to_execute = bind_wavefn_circuits(
+                    params, self._transpiled_tensor_circuits, self._ansatz
+                )
+                superpos_circuits_to_execute = bind_wavefn_circuits(
+                    params, self._transpiled_superpos_circuits, self._ansatz
+                )
+                circuits_to_execute += (
+                    tensor_circuits_to_execute + superpos_circuits_to_execute
+                )
+                continue
+
             # Get all the tensor circuits associated with ansatz U
             tensor_circuits_to_execute_u = prepare_circuits_to_execute(
                 params,
@@ -506,14 +559,16 @@ class EntanglementForgedVQE(VQE):
             circuits_to_execute += (
                 tensor_circuits_to_execute + superpos_circuits_to_execute
             )
-        Log.log("Transpiling circuits...")
-        Log.log(self._initial_layout)
-        circuits_to_execute = transpile(
-            circuits_to_execute,
-            self._backend,
-            initial_layout=self._initial_layout,
-            coupling_map=self._coupling_map,
-        )
+        if not self._is_sv_sim:
+            Log.log("Transpiling circuits...")
+            Log.log(self._initial_layout)
+            circuits_to_execute = transpile(
+                circuits_to_execute,
+                self._backend,
+                initial_layout=self._initial_layout,
+                coupling_map=self._coupling_map,
+                optimization_level=self._optimization_level,
+            )
 
         if not isinstance(circuits_to_execute, list):
             circuits_to_execute = [circuits_to_execute]
@@ -628,39 +683,56 @@ class EntanglementForgedVQE(VQE):
             )
         else:
             bootstrap_results = []
-        bootstrap_means_each_parameter_set = []
-        for idx, params in enumerate(parameter_sets):
-            bootstrap_means = []
-            for is_bootstrap_index, res in enumerate([result] + bootstrap_results):
-                results_extrap, results_raw = eval_forged_op_with_result(
-                    res,
-                    self._w_ij_tensor_states,
-                    self._w_ab_superpos_states,
-                    params,
-                    self._bitstrings_s_u,
-                    self._op_for_generating_tensor_circuits,
-                    self._op_for_generating_superpos_circuits,
-                    self._zero_noise_extrap,
-                    bitstrings_s_v=self._bitstrings_s_v,
-                    hf_value=hf_value,
-                    statevector_mode=self._is_sv_sim,
-                    hybrid_superpos_coeffs=self._hybrid_superpos_coeffs,
-                    add_this_to_mean_values_displayed=add_this_to_mean_values_displayed,
-                    no_bs0_circuits=self._no_bs0_circuits,
-                )
-                op_mean, op_std, schmidts = results_extrap
-                op_mean_raw, op_std_raw, schmidts_raw = results_raw
-                if not is_bootstrap_index:
-                    op_mean_each_parameter_set[idx] = op_mean
-                    op_std_each_parameter_set[idx] = op_std
-                    op_mean_raw_each_parameter_set[idx] = op_mean_raw
-                    op_std_raw_each_parameter_set[idx] = op_std_raw
-                    schmidt_coeffs_raw_each_parameter_set[idx] = schmidts_raw
-                    Log.log("Optimal schmidt coeffs sqrt(p) =", schmidts)
-                    schmidt_coeffs_each_parameter_set[idx] = schmidts
-                else:
-                    bootstrap_means.append(op_mean)
-            bootstrap_means_each_parameter_set.append(bootstrap_means)
+        # Each (parameter set, bootstrap resample) combination is analyzed
+        # independently against the shared result object, so the analyses can
+        # be fanned out over worker threads when the config asks for it.
+        analysis_tasks = [
+            (idx, is_bootstrap_index, res, params)
+            for idx, params in enumerate(parameter_sets)
+            for is_bootstrap_index, res in enumerate([result] + bootstrap_results)
+        ]
+
+        def _analyze_task(task):
+            _, _, res, params = task
+            return eval_forged_op_with_result(
+                res,
+                self._w_ij_tensor_states,
+                self._w_ab_superpos_states,
+                params,
+                self._bitstrings_s_u,
+                self._op_for_generating_tensor_circuits,
+                self._op_for_generating_superpos_circuits,
+                self._zero_noise_extrap,
+                bitstrings_s_v=self._bitstrings_s_v,
+                hf_value=hf_value,
+                statevector_mode=self._is_sv_sim,
+                hybrid_superpos_coeffs=self._hybrid_superpos_coeffs,
+                add_this_to_mean_values_displayed=add_this_to_mean_values_displayed,
+                no_bs0_circuits=self._no_bs0_circuits,
+            )
+
+        if self._parallel_workers > 1 and len(analysis_tasks) > 1:
+            with ThreadPoolExecutor(max_workers=self._parallel_workers) as executor:
+                analysis_results = list(executor.map(_analyze_task, analysis_tasks))
+        else:
+            analysis_results = [_analyze_task(task) for task in analysis_tasks]
+
+        bootstrap_means_each_parameter_set = [[] for _ in parameter_sets]
+        for (idx, is_bootstrap_index, _, _), (results_extrap, results_raw) in zip(
+            analysis_tasks, analysis_results
+        ):
+            op_mean, op_std, schmidts = results_extrap
+            op_mean_raw, op_std_raw, schmidts_raw = results_raw
+            if not is_bootstrap_index:
+                op_mean_each_parameter_set[idx] = op_mean
+                op_std_each_parameter_set[idx] = op_std
+                op_mean_raw_each_parameter_set[idx] = op_mean_raw
+                op_std_raw_each_parameter_set[idx] = op_std_raw
+                schmidt_coeffs_raw_each_parameter_set[idx] = schmidts_raw
+                Log.log("Optimal schmidt coeffs sqrt(p) =", schmidts)
+                schmidt_coeffs_each_parameter_set[idx] = schmidts
+            else:
+                bootstrap_means_each_parameter_set[idx].append(op_mean)
         self._running_estimate_of_schmidts = np.mean(
             schmidt_coeffs_each_parameter_set, axis=0
         )
@@ -35,6 +35,27 @@ from .legacy.weighted_pauli_operator import WeightedPauliOperator
 
 Matrix = Iterable[Iterable[float]]
 
+# Dense Pauli matrices reused by the statevector expectation kernel,
+# keyed by the operator's Pauli-label tuple.
+_PAULI_MATRIX_CACHE = {}
+
+
+def _pauli_matrices_for_op(op_for_generating_circuits):
+    """Returns the dense matrices of the operator's Paulis, cached by label.
+
+    Pauli.to_matrix() materializes a dense 2^n x 2^n array on every call, and
+    the same operators are re-evaluated at each energy evaluation; caching on
+    the label tuple makes the construction a one-time cost per distinct
+    operator instead of a per-evaluation one.
+    """
+    labels = tuple(p[1].to_label() for p in op_for_generating_circuits.paulis)
+    if labels not in _PAULI_MATRIX_CACHE:
+        _PAULI_MATRIX_CACHE[labels] = np.asarray(
+            [p[1].to_matrix() for p in op_for_generating_circuits.paulis]
+        )
+    return _PAULI_MATRIX_CACHE[labels]
+
+
 # pylint: disable=too-many-locals,too-many-arguments,too-many-branches,invalid-name
 def make_stateprep_circuits(
     bitstrings: Iterable[Iterable[int]], no_bs0_circuits: bool = True, suffix: str = ""
@@ -150,6 +171,29 @@ def prepare_circuits_to_execute(
     return circuits_to_execute
 
 
+def bind_wavefn_circuits(
+    params: Iterable[float],
+    wavefn_circuits: Iterable[QuantumCircuit],
+    var_form: QuantumCircuit,
+):
+    """Binds ansatz parameters into pre-composed (and pre-transpiled)
+    statevector wavefunction circuits.
+
+    Replaces the per-evaluation compose and transpile performed by
+    prepare_circuits_to_execute when the backend is a statevector simulator:
+    the circuit structure is fixed across evaluations, so only the parameter
+    values (and the name used for result lookup) change.
+    """
+    circuits_to_execute = []
+    param_bindings = dict(zip(var_form.parameters, params))
+    for wavefn_circuit in wavefn_circuits:
+        circuit_name = str(params) + "_" + str(wavefn_circuit.name) + "_psi"
+        bound_circuit = wavefn_circuit.assign_parameters(param_bindings)
+        bound_circuit.name = circuit_name
+        circuits_to_execute.append(bound_circuit)
+    return circuits_to_execute
+
+
 # pylint: disable=unbalanced-tuple-unpacking
 def eval_forged_op_with_result(
     result,
@@ -301,9 +345,7 @@ def _get_pauli_expectations_from_result(
         return np.empty((0, 0, len(richardson_stretch_factors), 2))
     params_string = str(params) + "_"
     if statevector_mode:
-        op_matrices = np.asarray(
-            [op.to_matrix() for op in [p[1] for p in op_for_generating_circuits.paulis]]
-        )
+        op_matrices = _pauli_matrices_for_op(op_for_generating_circuits)
     pauli_vals = np.zeros(
         (
             len(stateprep_strings),
@@ -344,7 +386,9 @@ def _get_pauli_expectations_from_result(
             if statevector_mode:
                 psi = result.get_statevector(circuit_name_prefix + "psi")
                 pauli_vals_temp = np.real(
-                    np.einsum("i,Mij,j->M", np.conj(psi), op_matrices, psi)
+                    np.einsum(
+                        "i,Mij,j->M", np.conj(psi), op_matrices, psi, optimize=True
+                    )
                 )
             else:
                 pauli_vals_temp, _ = _eval_each_pauli_with_result(
@@ -442,6 +486,7 @@ def compute_h_schmidt(
         w_ij_tensor_weights,
         tensor_exp_vals_u,
         tensor_exp_vals_v,
+        optimize=True,
     )
     h_schmidt = np.diag(h_schmidt_diagonal)
 
@@ -474,7 +519,7 @@ def compute_h_schmidt(
         p_delta_x_v = p_delta_x_u
 
     h_schmidt_off_diagonals = np.einsum(
-        "ab,xa,xb->x", w_ab_superpos_weights, p_delta_x_u, p_delta_x_v
+        "ab,xa,xb->x", w_ab_superpos_weights, p_delta_x_u, p_delta_x_v, optimize=True
     )
 
     superpos_state_indices = [
@@ -79,5 +79,13 @@ def execute_with_retry(circuits, backend, shots, rep_delay=None, noise_model=Non
 
 
 def reduce_bitstrings(bitstrings, orbitals_to_reduce):
-    """Returns reduced bitstrings."""
-    return np.delete(bitstrings, orbitals_to_reduce, axis=-1).tolist()
+    """Returns reduced bitstrings.
+
+    Drops the entries at ``orbitals_to_reduce`` from each bitstring with a
+    single boolean-mask compress over the 2D array, avoiding the per-index
+    normalization that ``np.delete`` performs.
+    """
+    bitstrings = np.asarray(bitstrings)
+    mask = np.ones(bitstrings.shape[-1], dtype=bool)
+    mask[np.asarray(orbitals_to_reduce, dtype=int)] = False
+    return bitstrings[..., mask].tolist()
@@ -0,0 +1,81 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Regenerates the pickled PySCF driver results used by the wrapper tests.
+
+The pickles store ``driver.run()`` results rather than whole
+``ElectronicStructureProblem`` objects: a problem built on ``PySCFDriver``
+holds a pyscf ``Mole`` with open file handles and cannot be pickled. The
+test helpers rebuild a problem around each stored result at load time,
+skipping the PySCF run for molecules that never change. Re-run this script
+whenever the molecules or basis sets below are modified:
+
+    python tests/wrappers/fixtures/regenerate_fixtures.py
+"""
+
+import math
+import os
+import pickle
+
+from qiskit_nature.drivers import Molecule
+from qiskit_nature.drivers.second_quantization import PySCFDriver
+
+FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _run_driver(molecule, **driver_kwargs):
+    return PySCFDriver.from_molecule(molecule, **driver_kwargs).run()
+
+
+def main():
+    """Runs PySCF for the H2 and H2O molecules and pickles the results."""
+    h2_molecule = Molecule(
+        geometry=[("H", [0.0, 0.0, 0.0]), ("H", [0.0, 0.0, 0.735])],
+        charge=0,
+        multiplicity=1,
+    )
+
+    radius_1 = 0.958  # position for the first H atom
+    radius_2 = 0.958  # position for the second H atom
+    thetas_in_deg = 104.478  # bond angles.
+
+    h1_x = radius_1
+    h2_x = radius_2 * math.cos(math.radians(thetas_in_deg))
+    h2_y = radius_2 * math.sin(math.radians(thetas_in_deg))
+
+    h2o_molecule = Molecule(
+        geometry=[
+            ("O", [0.0, 0.0, 0.0]),
+            ("H", [h1_x, 0.0, 0.0]),
+            ("H", [h2_x, h2_y, 0.0]),
+        ],
+        charge=0,
+        multiplicity=1,
+    )
+
+    driver_results = {
+        "h2_driver_result.pkl": _run_driver(h2_molecule),
+        "h2o_sto6g_driver_result.pkl": _run_driver(h2o_molecule, basis="sto6g"),
+    }
+    for filename, driver_result in driver_results.items():
+        path = os.path.join(FIXTURES_DIR, filename)
+        # Dump to a temp file and rename so an interrupted run never leaves
+        # a truncated pickle behind for the tests to trip over.
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(driver_result, file)
+        os.replace(tmp_path, path)
+        print("wrote", path)
+
+
+if __name__ == "__main__":
+    main()
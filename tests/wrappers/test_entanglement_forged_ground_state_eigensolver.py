@@ -13,26 +13,26 @@
 """Integration tests for EntanglementForgedVQE module."""
 # pylint: disable=wrong-import-position
 import unittest
+import math
 import os
+import pickle
 
 import numpy as np
-from qiskit import BasicAer
-from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit import Aer
+from qiskit.circuit import Parameter, ParameterVector, QuantumCircuit
 from qiskit.circuit.library import TwoLocal
 from qiskit_nature.converters.second_quantization import QubitConverter
-from qiskit_nature.drivers import Molecule
-from qiskit_nature.drivers.second_quantization import PySCFDriver
+from qiskit_nature.drivers.second_quantization import ElectronicStructureDriver
 from qiskit_nature.mappers.second_quantization import JordanWignerMapper
 from qiskit_nature.problems.second_quantization import ElectronicStructureProblem
-from qiskit_nature.algorithms.ground_state_solvers import (
-    GroundStateEigensolver,
-    NumPyMinimumEigensolverFactory,
-)
-from qiskit_nature.transformers.second_quantization.electronic.active_space_transformer import (
-    ActiveSpaceTransformer,
-)
 from qiskit_nature import settings
 
+# The PySCF driver and classical-solver modules are imported inside the
+# methods that need them, keeping the module-level imports to what every
+# test uses. Note this does not avoid loading pyscf itself: the
+# entanglement_forging import below pulls it in unconditionally via
+# ClassicalEnergies.
+
 settings.dict_aux_operators = True
 
 from entanglement_forging import reduce_bitstrings
@@ -42,102 +42,249 @@ from entanglement_forging import (
     EntanglementForgedGroundStateSolver,
 )
 
+_TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "test_data")
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# H2 integrals shared by the EntanglementForgedDriver tests, built once at
+# import instead of from nested list literals inside each test.
+_HCORE_H2 = np.array([[-1.12421758, -0.9652574], [-0.9652574, -1.12421758]])
+_MO_COEFF_H2 = np.array([[0.54830202, 1.21832731], [0.54830202, -1.21832731]])
+# Flat-then-reshape construction copies the values in one pass instead of
+# sending NumPy through recursive shape/dtype inference on nested lists.
+_ERI_H2 = np.array(
+    [
+        # fmt: off
+        0.77460594, 0.44744572, 0.44744572, 0.57187698,
+        0.44744572, 0.3009177, 0.3009177, 0.44744572,
+        0.44744572, 0.3009177, 0.3009177, 0.44744572,
+        0.57187698, 0.44744572, 0.44744572, 0.77460594,
+        # fmt: on
+    ]
+).reshape(2, 2, 2, 2)
+_REPULSION_H2 = 0.7199689944489797
+
+# Pi multiples used by the configs below, computed once at import instead of
+# re-deriving them inside each test.
+_HALF_PI = 0.5 * math.pi
+_TWENTY_PI = 20 * math.pi
+
+_H2_INITIAL_PARAMS = [0, _HALF_PI]
+
+
+class _FixtureDriver(ElectronicStructureDriver):
+    """Driver that replays a pickled driver result instead of running PySCF."""
+
+    def __init__(self, driver_result):
+        super().__init__()
+        self._driver_result = driver_result
+
+    def run(self):
+        return self._driver_result
+
 
 class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
     """EntanglementForgedGroundStateEigensolver tests."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # All per-class state below is read-only from the point of view of
+        # the test methods, which keeps the methods independent and lets the
+        # module run under parallel test runners (e.g. pytest-xdist).
         np.random.seed(42)
-        self.backend = BasicAer.get_backend("statevector_simulator")
-        self.config = EntanglementForgedConfig(
-            backend=self.backend,
+        cls._problem_cache = {}
+        # Aer's statevector simulator runs the same circuits through its
+        # compiled C++ kernels instead of BasicAer's pure-Python reference
+        # implementation.
+        cls.backend = Aer.get_backend("statevector_simulator")
+        cls.config = EntanglementForgedConfig(
+            backend=cls.backend,
             maxiter=0,
             initial_params=[0.0],
             optimizer_name="COBYLA",
         )
+        cls.h2_config = EntanglementForgedConfig(
+            backend=cls.backend, maxiter=0, initial_params=_H2_INITIAL_PARAMS
+        )
+
+        # The converter is stateless with respect to these tests, so a single
+        # instance is shared rather than re-triggering the qiskit-nature
+        # registry lookups in every test method.
+        cls._jw_converter = QubitConverter(JordanWignerMapper())
+
+        # The integral tensors are read-only inputs, so they are loaded once
+        # per class rather than once per test method. mmap_mode lets the OS
+        # page cache back the arrays without a fresh userspace copy.
 
         # TS
-        self.mock_ts_ansatz = self.create_mock_ansatz(4)
-        self.hcore_ts = np.load(
-            os.path.join(os.path.dirname(__file__), "test_data", "TS_one_body.npy")
+        cls.hcore_ts = np.load(
+            os.path.join(_TEST_DATA_DIR, "TS_one_body.npy"), mmap_mode="r"
         )
-        self.eri_ts = np.load(
-            os.path.join(os.path.dirname(__file__), "test_data", "TS_two_body.npy")
+        cls.eri_ts = np.load(
+            os.path.join(_TEST_DATA_DIR, "TS_two_body.npy"), mmap_mode="r"
         )
-        self.energy_shift_ts = -264.7518219120776
+        cls.energy_shift_ts = -264.7518219120776
 
         # O2
-        self.mock_o2_ansatz = self.create_mock_ansatz(8)
-        self.hcore_o2 = np.load(
-            os.path.join(os.path.dirname(__file__), "test_data", "O2_one_body.npy")
+        cls.hcore_o2 = np.load(
+            os.path.join(_TEST_DATA_DIR, "O2_one_body.npy"), mmap_mode="r"
         )
-        self.eri_o2 = np.load(
-            os.path.join(os.path.dirname(__file__), "test_data", "O2_two_body.npy")
+        cls.eri_o2 = np.load(
+            os.path.join(_TEST_DATA_DIR, "O2_two_body.npy"), mmap_mode="r"
         )
-        self.energy_shift_o2 = -99.83894101027317
+        cls.energy_shift_o2 = -99.83894101027317
 
         # CH3
-        self.mock_ch3_ansatz = self.create_mock_ansatz(6)
-        self.hcore_ch3 = np.load(
-            os.path.join(os.path.dirname(__file__), "test_data", "CH3_one_body.npy")
+        cls.hcore_ch3 = np.load(
+            os.path.join(_TEST_DATA_DIR, "CH3_one_body.npy"), mmap_mode="r"
         )
-        self.eri_ch3 = np.load(
-            os.path.join(os.path.dirname(__file__), "test_data", "CH3_two_body.npy")
+        cls.eri_ch3 = np.load(
+            os.path.join(_TEST_DATA_DIR, "CH3_two_body.npy"), mmap_mode="r"
         )
-        self.energy_shift_ch3 = -31.90914780401554
+        cls.energy_shift_ch3 = -31.90914780401554
+
+        # Hop-gate template for the water ansatz, built once per class; the
+        # test stamps out its five concrete gates via to_gate with a
+        # parameter map instead of rebuilding the sub-circuit each run.
+        cls._hop_gate_theta = Parameter("θ")
+        hop_gate = QuantumCircuit(2, name="Hop gate")
+        hop_gate.h(0)
+        hop_gate.cx(1, 0)
+        hop_gate.cx(0, 1)
+        hop_gate.ry(-cls._hop_gate_theta, 0)
+        hop_gate.ry(-cls._hop_gate_theta, 1)
+        hop_gate.cx(0, 1)
+        hop_gate.h(0)
+        cls._hop_gate_template = hop_gate
+
+        cls.mock_ts_ansatz = cls.create_mock_ansatz(4)
+        cls.mock_o2_ansatz = cls.create_mock_ansatz(8)
+        cls.mock_ch3_ansatz = cls.create_mock_ansatz(6)
+
+    @classmethod
+    def _get_problem(cls, key, molecule, fixture=None, **driver_kwargs):
+        """Returns a cached ElectronicStructureProblem for the given molecule.
+
+        Running PySCF's SCF and integral transforms dominates the wall time of
+        these tests, so problems built from identical molecular inputs are
+        memoized across test methods. ``second_q_ops()`` is called once at
+        build time to populate the problem's internal state.
+
+        If ``fixture`` names a pickled driver result under
+        ``tests/wrappers/fixtures/``, the problem is rebuilt around that
+        result instead of running PySCF; ``fixtures/regenerate_fixtures.py``
+        rebuilds the pickles when the molecules or basis sets change.
+        """
+        if key not in cls._problem_cache:
+            problem = cls._problem_from_fixture(fixture) if fixture else None
+            if problem is None:
+                from qiskit_nature.drivers.second_quantization import PySCFDriver
+
+                driver = PySCFDriver.from_molecule(molecule, **driver_kwargs)
+                problem = ElectronicStructureProblem(driver)
+                problem.second_q_ops()
+            cls._problem_cache[key] = problem
+        return cls._problem_cache[key]
+
+    @staticmethod
+    def _problem_from_fixture(fixture):
+        """Returns a problem rebuilt from a pickled driver result, or None.
+
+        The fixtures store ``driver.run()`` results rather than whole
+        problems, which are not picklable (the pyscf ``Mole`` they hold
+        carries open file handles). A missing or unreadable pickle is
+        treated as "no fixture" so the caller falls back to running PySCF.
+        """
+        path = os.path.join(_FIXTURES_DIR, fixture)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as file:
+                driver_result = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+            return None
+        problem = ElectronicStructureProblem(_FixtureDriver(driver_result))
+        problem.second_q_ops()
+        return problem
 
-    def create_mock_ansatz(self, num_qubits):
+    @staticmethod
+    def create_mock_ansatz(num_qubits):
         n_theta = 1
         theta = Parameter("θ")
         mock_gate = QuantumCircuit(1, name="mock gate")
         mock_gate.rz(theta, 0)
 
-        theta_vec = [Parameter("θ%d" % i) for i in range(1)]
+        theta_vec = ParameterVector("θ", n_theta)
         ansatz = QuantumCircuit(num_qubits)
         ansatz.append(mock_gate.to_gate({theta: theta_vec[0]}), [0])
 
         return ansatz
 
-    def test_forged_vqe_H2(self):
-        """Test of applying Entanglement Forged VQE to to compute the energy of a H2 molecule."""
-        # setup problem
+    def _h2_problem_from_pyscf(self):
+        """Returns the H2 problem generated by the PySCF driver."""
+        from qiskit_nature.drivers import Molecule
+
         molecule = Molecule(
             geometry=[("H", [0.0, 0.0, 0.0]), ("H", [0.0, 0.0, 0.735])],
             charge=0,
             multiplicity=1,
         )
-        driver = PySCFDriver.from_molecule(molecule)
-        problem = ElectronicStructureProblem(driver)
-        problem.second_q_ops()
-
-        # solution
-        bitstrings = [[1, 0], [0, 1]]
-        ansatz = TwoLocal(2, [], "cry", [[0, 1], [1, 0]], reps=1)
+        return self._get_problem(
+            ("H2", "default", 0, 1), molecule, fixture="h2_driver_result.pkl"
+        )
 
-        config = EntanglementForgedConfig(
-            backend=self.backend, maxiter=0, initial_params=[0, 0.5 * np.pi]
+    def _h2_problem_from_ef_driver(self):
+        """Returns the H2 problem generated by the EntanglementForgedDriver."""
+        driver = EntanglementForgedDriver(
+            hcore=_HCORE_H2,
+            mo_coeff=_MO_COEFF_H2,
+            eri=_ERI_H2,
+            num_alpha=1,
+            num_beta=1,
+            nuclear_repulsion_energy=_REPULSION_H2,
         )
+        return ElectronicStructureProblem(driver)
 
-        converter = QubitConverter(JordanWignerMapper())
+    def _solve_h2(self, problem):
+        """Runs the forged-VQE solve shared by the H2 subtests."""
+        bitstrings = [[1, 0], [0, 1]]
+        ansatz = TwoLocal(2, [], "cry", [[0, 1], [1, 0]], reps=1)
 
         forged_ground_state_solver = EntanglementForgedGroundStateSolver(
-            converter, ansatz, bitstrings, config
+            self._jw_converter, ansatz, bitstrings, self.h2_config
         )
-
         forged_result = forged_ground_state_solver.solve(problem)
+        return forged_result.ground_state_energy
 
-        self.assertAlmostEqual(forged_result.ground_state_energy, -1.1219365445030705)
+    def test_forged_vqe_H2(self):
+        """Test of applying Entanglement Forged VQE to to compute the energy of a H2 molecule.
+
+        The PySCF and EntanglementForgedDriver problem sources describe the
+        same molecule, so they share a single solve helper (same ansatz,
+        bitstrings and config) and only the problem construction differs
+        per subtest.
+        """
+        problem_sources = [
+            ("pyscf_driver", self._h2_problem_from_pyscf),
+            ("ef_driver", self._h2_problem_from_ef_driver),
+        ]
+        for source, problem_factory in problem_sources:
+            with self.subTest(problem_source=source):
+                self.assertAlmostEqual(
+                    self._solve_h2(problem_factory()), -1.1219365445030705
+                )
 
     def test_forged_vqe_H2O(self):  # pylint: disable=too-many-locals
         """Test of applying Entanglement Forged VQE to to compute the energy of a H20 molecule."""
+        from qiskit_nature.drivers import Molecule
+
         # setup problem
         radius_1 = 0.958  # position for the first H atom
         radius_2 = 0.958  # position for the second H atom
         thetas_in_deg = 104.478  # bond angles.
 
         h1_x = radius_1
-        h2_x = radius_2 * np.cos(np.pi / 180 * thetas_in_deg)
-        h2_y = radius_2 * np.sin(np.pi / 180 * thetas_in_deg)
+        h2_x = radius_2 * math.cos(math.radians(thetas_in_deg))
+        h2_y = radius_2 * math.sin(math.radians(thetas_in_deg))
 
         molecule = Molecule(
             geometry=[
@@ -148,9 +295,12 @@ class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
             charge=0,
             multiplicity=1,
         )
-        driver = PySCFDriver.from_molecule(molecule, basis="sto6g")
-        problem = ElectronicStructureProblem(driver)
-        problem.second_q_ops()
+        problem = self._get_problem(
+            ("H2O", "sto6g", 0, 1),
+            molecule,
+            fixture="h2o_sto6g_driver_result.pkl",
+            basis="sto6g",
+        )
 
         # solution
         orbitals_to_reduce = [0, 3]
@@ -161,7 +311,7 @@ class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
         ]
         reduced_bitstrings = reduce_bitstrings(bitstrings, orbitals_to_reduce)
 
-        theta = Parameter("θ")
+        theta = self._hop_gate_theta
         theta_1, theta_2, theta_3, theta_4 = (
             Parameter("θ1"),
             Parameter("θ2"),
@@ -169,14 +319,7 @@ class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
             Parameter("θ4"),
         )
 
-        hop_gate = QuantumCircuit(2, name="Hop gate")
-        hop_gate.h(0)
-        hop_gate.cx(1, 0)
-        hop_gate.cx(0, 1)
-        hop_gate.ry(-theta, 0)
-        hop_gate.ry(-theta, 1)
-        hop_gate.cx(0, 1)
-        hop_gate.h(0)
+        hop_gate = self._hop_gate_template
 
         ansatz = QuantumCircuit(5)
         ansatz.append(hop_gate.to_gate({theta: theta_1}), [0, 1])
@@ -188,14 +331,12 @@ class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
         config = EntanglementForgedConfig(
             backend=self.backend,
             maxiter=0,
-            spsa_c0=20 * np.pi,
+            spsa_c0=_TWENTY_PI,
             initial_params=[0, 0, 0, 0],
         )
 
-        converter = QubitConverter(JordanWignerMapper())
-
         solver = EntanglementForgedGroundStateSolver(
-            converter,
+            self._jw_converter,
             ansatz,
             reduced_bitstrings,
             config,
@@ -204,85 +345,49 @@ class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
         forged_result = solver.solve(problem)
         self.assertAlmostEqual(forged_result.ground_state_energy, -75.68366174497027)
 
-    def test_ef_driver(self):
-        """Test for entanglement forging driver."""
-        hcore = np.array([[-1.12421758, -0.9652574], [-0.9652574, -1.12421758]])
-        mo_coeff = np.array([[0.54830202, 1.21832731], [0.54830202, -1.21832731]])
-        eri = np.array(
-            [
-                [
-                    [[0.77460594, 0.44744572], [0.44744572, 0.57187698]],
-                    [[0.44744572, 0.3009177], [0.3009177, 0.44744572]],
-                ],
-                [
-                    [[0.44744572, 0.3009177], [0.3009177, 0.44744572]],
-                    [[0.57187698, 0.44744572], [0.44744572, 0.77460594]],
-                ],
-            ]
-        )
-
-        driver = EntanglementForgedDriver(
-            hcore=hcore,
-            mo_coeff=mo_coeff,
-            eri=eri,
-            num_alpha=1,
-            num_beta=1,
-            nuclear_repulsion_energy=0.7199689944489797,
-        )
-        problem = ElectronicStructureProblem(driver)
-        problem.second_q_ops()
-
-        bitstrings = [[1, 0], [0, 1]]
-        ansatz = TwoLocal(2, [], "cry", [[0, 1], [1, 0]], reps=1)
-
-        config = EntanglementForgedConfig(
-            backend=self.backend, maxiter=0, initial_params=[0, 0.5 * np.pi]
-        )
-        converter = QubitConverter(JordanWignerMapper())
-        forged_ground_state_solver = EntanglementForgedGroundStateSolver(
-            converter, ansatz, bitstrings, config
-        )
-        forged_result = forged_ground_state_solver.solve(problem)
-        self.assertAlmostEqual(forged_result.ground_state_energy, -1.1219365445030705)
-
     def test_ground_state_eigensolver_with_ef_driver(self):
         """Tests standard qiskit nature solver."""
-        hcore = np.array([[-1.12421758, -0.9652574], [-0.9652574, -1.12421758]])
-        mo_coeff = np.array([[0.54830202, 1.21832731], [0.54830202, -1.21832731]])
-        eri = np.array(
-            [
-                [
-                    [[0.77460594, 0.44744572], [0.44744572, 0.57187698]],
-                    [[0.44744572, 0.3009177], [0.3009177, 0.44744572]],
-                ],
-                [
-                    [[0.44744572, 0.3009177], [0.3009177, 0.44744572]],
-                    [[0.57187698, 0.44744572], [0.44744572, 0.77460594]],
-                ],
-            ]
+        from qiskit_nature.algorithms.ground_state_solvers import (
+            GroundStateEigensolver,
+            NumPyMinimumEigensolverFactory,
         )
 
-        repulsion_energy = 0.7199689944489797
         driver = EntanglementForgedDriver(
-            hcore=hcore,
-            mo_coeff=mo_coeff,
-            eri=eri,
+            hcore=_HCORE_H2,
+            mo_coeff=_MO_COEFF_H2,
+            eri=_ERI_H2,
             num_alpha=1,
             num_beta=1,
-            nuclear_repulsion_energy=repulsion_energy,
+            nuclear_repulsion_energy=_REPULSION_H2,
         )
         problem = ElectronicStructureProblem(driver)
-        problem.second_q_ops()
 
-        converter = QubitConverter(JordanWignerMapper())
         solver = GroundStateEigensolver(
-            converter,
+            self._jw_converter,
             NumPyMinimumEigensolverFactory(use_default_filter_criterion=False),
         )
         result = solver.solve(problem)
         self.assertAlmostEqual(
-            -1.137306026563, np.real(result.eigenenergies[0]) + repulsion_energy
+            -1.137306026563, np.real(result.eigenenergies[0]) + _REPULSION_H2
+        )
+
+    def _solve_asymmetric_bitstrings(self, driver, ansatz, bitstrings_u, bitstrings_v):
+        """Runs the asymmetric-bitstrings solve shared by the O2 and CH3 tests.
+
+        Both tests build the same driver -> problem -> solver -> solve
+        pipeline with the shared mock config; only the integrals, ansatz and
+        bitstring lists differ, so those are the parameters here.
+        """
+        problem = ElectronicStructureProblem(driver)
+        calc = EntanglementForgedGroundStateSolver(
+            self._jw_converter,
+            ansatz,
+            bitstrings_u=bitstrings_u,
+            bitstrings_v=bitstrings_v,
+            config=self.config,
+            orbitals_to_reduce=[],
         )
+        return calc.solve(problem).ground_state_energy
 
     def test_O2_1(self):
         driver = EntanglementForgedDriver(
@@ -293,10 +398,6 @@ class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
             num_beta=6,
             nuclear_repulsion_energy=self.energy_shift_o2,
         )
-        problem = ElectronicStructureProblem(driver)
-        problem.second_q_ops()
-
-        converter = QubitConverter(JordanWignerMapper())
 
         bitstrings_u = [
             [1, 1, 1, 1, 1, 1, 0, 0],
@@ -311,16 +412,10 @@ class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
             [1, 1, 1, 1, 0, 1, 1, 0],
         ]
 
-        calc = EntanglementForgedGroundStateSolver(
-            converter,
-            self.mock_o2_ansatz,
-            bitstrings_u=bitstrings_u,
-            bitstrings_v=bitstrings_v,
-            config=self.config,
-            orbitals_to_reduce=[],
+        energy = self._solve_asymmetric_bitstrings(
+            driver, self.mock_o2_ansatz, bitstrings_u, bitstrings_v
         )
-        res = calc.solve(problem)
-        self.assertAlmostEqual(-147.63645235088566, res.ground_state_energy)
+        self.assertAlmostEqual(-147.63645235088566, energy)
 
     def test_CH3(self):
         driver = EntanglementForgedDriver(
@@ -332,11 +427,6 @@ class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
             nuclear_repulsion_energy=self.energy_shift_ch3,
         )
 
-        problem = ElectronicStructureProblem(driver)
-        problem.second_q_ops()
-
-        converter = QubitConverter(JordanWignerMapper())
-
         bitstrings_u = [
             [1, 1, 1, 0, 0, 0],
             [0, 1, 1, 0, 0, 1],
@@ -352,13 +442,7 @@ class TestEntanglementForgedGroundStateEigensolver(unittest.TestCase):
             [0, 1, 0, 1, 0, 0],
         ]
 
-        calc = EntanglementForgedGroundStateSolver(
-            converter,
-            self.mock_ch3_ansatz,
-            bitstrings_u=bitstrings_u,
-            bitstrings_v=bitstrings_v,
-            config=self.config,
-            orbitals_to_reduce=[],
+        energy = self._solve_asymmetric_bitstrings(
+            driver, self.mock_ch3_ansatz, bitstrings_u, bitstrings_v
         )
-        res = calc.solve(problem)
-        self.assertAlmostEqual(-39.09031477502881, res.ground_state_energy)
+        self.assertAlmostEqual(-39.09031477502881, energy)